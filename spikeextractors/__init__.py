@@ -7,10 +7,81 @@ from .multirecordingchannelextractor import concatenate_recordings_by_channel, M
 from .multirecordingtimeextractor import concatenate_recordings_by_time, MultiRecordingTimeExtractor
 from .multisortingextractor import concatenate_sortings, MultiSortingExtractor
 
-from .extractorlist import *
+import sys as _sys
+import importlib as _importlib
+
+_extractor_modules = {
+    'MdaRecordingExtractor': '.extractors.mdaextractors.mdaextractors',
+    'MdaSortingExtractor': '.extractors.mdaextractors.mdaextractors',
+    'MEArecRecordingExtractor': '.extractors.mearecextractors.mearecextractors',
+    'MEArecSortingExtractor': '.extractors.mearecextractors.mearecextractors',
+    'BiocamRecordingExtractor': '.extractors.biocamrecordingextractor.biocamrecordingextractor',
+    'ExdirRecordingExtractor': '.extractors.exdirextractors.exdirextractors',
+    'ExdirSortingExtractor': '.extractors.exdirextractors.exdirextractors',
+    'IntanRecordingExtractor': '.extractors.intanrecordingextractor.intanrecordingextractor',
+    'HS2SortingExtractor': '.extractors.hs2sortingextractor.hs2sortingextractor',
+    'KlustaRecordingExtractor': '.extractors.klustaextractors.klustaextractors',
+    'KlustaSortingExtractor': '.extractors.klustaextractors.klustaextractors',
+    'KiloSortRecordingExtractor': '.extractors.kilosortextractors.kilosortextractors',
+    'KiloSortSortingExtractor': '.extractors.kilosortextractors.kilosortextractors',
+    'NumpyRecordingExtractor': '.extractors.numpyextractors.numpyextractors',
+    'NumpySortingExtractor': '.extractors.numpyextractors.numpyextractors',
+    'NwbRecordingExtractor': '.extractors.nwbextractors.nwbextractors',
+    'NwbSortingExtractor': '.extractors.nwbextractors.nwbextractors',
+    'MaxOneRecordingExtractor': '.extractors.maxonerecordingextractor',
+    'OpenEphysRecordingExtractor': '.extractors.openephysextractors.openephysextractors',
+    'OpenEphysSortingExtractor': '.extractors.openephysextractors.openephysextractors',
+    'PhyRecordingExtractor': '.extractors.phyextractors.phyextractors',
+    'PhySortingExtractor': '.extractors.phyextractors.phyextractors',
+    'BinDatRecordingExtractor': '.extractors.bindatrecordingextractor.bindatrecordingextractor',
+    'SpykingCircusRecordingExtractor': '.extractors.spykingcircusextractors.spykingcircusextractors',
+    'SpykingCircusSortingExtractor': '.extractors.spykingcircusextractors.spykingcircusextractors',
+    'SpikeGLXRecordingExtractor': '.extractors.spikeglxrecordingextractor.spikeglxrecordingextractor',
+    'TridesclousSortingExtractor': '.extractors.tridescloussortingextractor.tridescloussortingextractor',
+    'NpzSortingExtractor': '.extractors.npzsortingextractor.npzsortingextractor',
+    'MCSH5RecordingExtractor': '.extractors.mcsh5recordingextractor.mcsh5recordingextractor',
+    'SHYBRIDRecordingExtractor': '.extractors.shybridextractors',
+    'SHYBRIDSortingExtractor': '.extractors.shybridextractors',
+    'NIXIORecordingExtractor': '.extractors.nixioextractors.nixioextractors',
+    'NIXIOSortingExtractor': '.extractors.nixioextractors.nixioextractors',
+}
+
+# the lists/dicts need every extractor class, so they are only built on first access
+for _name in ['recording_extractor_full_list', 'recording_extractor_dict', 'installed_recording_extractor_list',
+              'sorting_extractor_full_list', 'sorting_extractor_dict', 'installed_sorting_extractor_list',
+              'writable_sorting_extractor_list', 'sorting_exporter_dict']:
+    _extractor_modules[_name] = '.extractorlist'
+del _name
+
+
+def __getattr__(name):
+    # extractors (and their optional dependencies) are imported on first access
+    if name == 'extractorlist':
+        return _importlib.import_module('.extractorlist', __name__)
+    if name not in _extractor_modules:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    module = _importlib.import_module(_extractor_modules[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_extractor_modules) | {'extractorlist'})
+
+
+if _sys.version_info < (3, 7):
+    # module level __getattr__ (PEP 562) is ignored before Python 3.7: import everything eagerly
+    from .extractorlist import *
 
 from . import example_datasets
 from .extraction_tools import load_probe_file, save_to_probe_file, read_binary, write_to_binary_dat_format, \
     get_sub_extractors_by_property
 
 from .version import version as __version__
+
+__all__ = ['RecordingExtractor', 'SortingExtractor', 'CacheRecordingExtractor', 'SubSortingExtractor',
+           'SubRecordingExtractor', 'concatenate_recordings_by_channel', 'MultiRecordingChannelExtractor',
+           'concatenate_recordings_by_time', 'MultiRecordingTimeExtractor', 'concatenate_sortings',
+           'MultiSortingExtractor', 'example_datasets', 'load_probe_file', 'save_to_probe_file', 'read_binary',
+           'write_to_binary_dat_format', 'get_sub_extractors_by_property'] + list(_extractor_modules)
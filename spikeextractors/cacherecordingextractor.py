@@ -11,7 +11,7 @@ class CacheRecordingExtractor(BinDatRecordingExtractor):
     def __init__(self, recording, chunk_size=None, output_folder=None):
         self._recording = recording
         self._tmp_file = tempfile.NamedTemporaryFile(suffix=".dat", dir=output_folder).name
-        dtype = recording.get_traces(start_frame=0, end_frame=2).dtype
+        dtype = recording.get_dtype()
         recording.write_to_binary_dat_format(save_path=self._tmp_file, dtype=dtype, chunk_size=chunk_size)
         BinDatRecordingExtractor.__init__(self, self._tmp_file, numchan=recording.get_num_channels(),
                                           recording_channels=recording.get_channel_ids(),
@@ -77,7 +77,7 @@ def load_probe_file(recording, probe_file, channel_map=None, channel_groups=None
     probe_file = Path(probe_file)
     if probe_file.suffix == '.prb':
         probe_dict = read_python(probe_file)
-        if 'channel_groups' in probe_dict.keys():
+        if 'channel_groups' in probe_dict:
             ordered_channels = np.array([], dtype=int)
             groups = sorted(probe_dict['channel_groups'].keys())
             for cgroup_id in groups:
@@ -91,10 +91,10 @@ def load_probe_file(recording, probe_file, channel_map=None, channel_groups=None
             subrecording = SubRecordingExtractor(recording, channel_ids=present_ordered_channels)
             for cgroup_id in groups:
                 cgroup = probe_dict['channel_groups'][cgroup_id]
-                if 'channels' not in cgroup.keys() and len(groups) > 1:
+                if 'channels' not in cgroup and len(groups) > 1:
                     raise Exception("If more than one 'channel_group' is in the probe file, the 'channels' field"
                                     "for each channel group is required")
-                elif 'channels' not in cgroup.keys():
+                elif 'channels' not in cgroup:
                     channels_in_group = subrecording.get_num_channels()
                     channels_id_in_group = subrecording.get_channel_ids()
                 else:
@@ -113,7 +113,7 @@ def load_probe_file(recording, probe_file, channel_map=None, channel_groups=None
                                 if i_ch in subrecording.get_channel_ids():
                                     subrecording.set_channel_property(i_ch, 'location', prop)
                         elif isinstance(prop_val, (list, np.ndarray)) and len(prop_val) == channels_in_group:
-                            if 'channels' not in cgroup.keys():
+                            if 'channels' not in cgroup:
                                 raise Exception("'geometry'/'location' in the .prb file can be a list only if "
                                                 "'channels' field is specified.")
                             if len(prop_val) != channels_in_group and verbose:
@@ -131,7 +131,7 @@ def load_probe_file(recording, probe_file, channel_map=None, channel_groups=None
                                 if i_ch in subrecording.get_channel_ids():
                                     subrecording.set_channel_property(i_ch, key_prop, prop)
                 # create dummy locations
-                if 'geometry' not in cgroup.keys() and 'location' not in cgroup.keys():
+                if 'geometry' not in cgroup and 'location' not in cgroup:
                     for i, chan in enumerate(subrecording.get_channel_ids()):
                         subrecording.set_channel_property(chan, 'location', [0, i])
         else:
@@ -276,11 +276,8 @@ def write_to_binary_dat_format(recording, save_path, time_axis=0, dtype=None, ch
         save_path = save_path.parent / (save_path.name + '.dat')
 
     if chunk_size is None:
-        traces = recording.get_traces()
-        if dtype is not None:
-            traces = traces.astype(dtype)
-        if time_axis == 0:
-            traces = traces.T
+        traces = recording.get_traces_array(time_axis=time_axis)
+        traces = np.asarray(traces, dtype=dtype, order='C')
         with save_path.open('wb') as f:
             traces.tofile(f)
     else:
@@ -291,12 +288,10 @@ def write_to_binary_dat_format(recording, save_path, time_axis=0, dtype=None, ch
             n_chunk += 1
         with save_path.open('wb') as f:
             for i in range(n_chunk):
-                traces = recording.get_traces(start_frame=i*chunk_size,
-                                              end_frame=min((i+1)*chunk_size, n_sample))
-                if dtype is not None:
-                    traces = traces.astype(dtype)
-                if time_axis == 0:
-                    traces = traces.T
+                traces = recording.get_traces_array(start_frame=i*chunk_size,
+                                                    end_frame=min((i+1)*chunk_size, n_sample),
+                                                    time_axis=time_axis)
+                traces = np.asarray(traces, dtype=dtype, order='C')
                 f.write(traces.tobytes())
     return save_path
 
@@ -60,11 +60,8 @@ class BinDatRecordingExtractor(RecordingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = self.get_num_frames()
-        if channel_ids is None:
-            channel_ids = list(range(self._timeseries.shape[0]))
-        else:
-            channel_ids = [self._channels.index(ch) for ch in channel_ids]
-        recordings = self._timeseries[:, start_frame:end_frame][channel_ids, :]
+        channel_idxs = self._normalize_channel_ids(channel_ids)
+        recordings = self._read_2d(self._timeseries, start_frame, end_frame, channel_idxs)
         if self._dtype.startswith('uint'):
             exp_idx = self._dtype.find('int') + 3
             exp = int(self._dtype[exp_idx:])
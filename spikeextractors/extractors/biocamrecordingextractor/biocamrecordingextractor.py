@@ -51,11 +51,10 @@ class BiocamRecordingExtractor(RecordingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = self.get_num_frames()
-        if channel_ids is None:
-            channel_ids = range(self.get_num_channels())
+        channel_idxs = self._normalize_channel_ids(channel_ids)
         data = self._read_function(
             self._rf, start_frame, end_frame, self.get_num_channels())
-        return data[:, channel_ids].T
+        return data[:, channel_idxs].T
 
     @staticmethod
     def write_recording(recording, save_path):
@@ -77,8 +76,8 @@ class BiocamRecordingExtractor(RecordingExtractor):
         dr = rf.create_dataset('3BData/Raw', (M*N,), dtype=int)
         dt = 50000
         for i in range(N//dt):
-            dr[M*i*dt:M*(i+1)*dt] = recording.get_traces(slice(0, M), i*dt, (i+1)*dt).T.flatten()
-        dr[M*(N//dt)*dt:] = recording.get_traces(slice(0, M), (N//dt)*dt, N).T.flatten()
+            dr[M*i*dt:M*(i+1)*dt] = recording.get_traces(start_frame=i*dt, end_frame=(i+1)*dt).T.flatten()
+        dr[M*(N//dt)*dt:] = recording.get_traces(start_frame=(N//dt)*dt, end_frame=N).T.flatten()
         g.attrs['Version'] = 101
         rf.create_dataset('3BRecInfo/3BRecVars/MinVolt', data=[0])
         rf.create_dataset('3BRecInfo/3BRecVars/MaxVolt', data=[1])
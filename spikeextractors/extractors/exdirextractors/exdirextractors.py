@@ -48,9 +48,8 @@ class ExdirRecordingExtractor(RecordingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = self.get_num_frames()
-        if channel_ids is None:
-            channel_ids = self.get_channel_ids()
-        return self._recordings.data[np.array(channel_ids), start_frame:end_frame]
+        channel_idxs = self._normalize_channel_ids(channel_ids)
+        return self._read_2d(self._recordings.data, start_frame, end_frame, channel_idxs)
 
     @staticmethod
     def write_recording(recording, save_path, lfp=False, mua=False):
@@ -212,7 +211,7 @@ class ExdirSortingExtractor(SortingExtractor):
         exdir_group = exdir.File(folder_path, plugins=exdir.plugins.quantities)
 
         electrophysiology = None
-        if 'processing' in exdir_group.keys():
+        if 'processing' in exdir_group:
             if 'electrophysiology' in exdir_group['processing']:
                 electrophysiology = exdir_group['processing']['electrophysiology']
                 ephys_attrs = electrophysiology.attrs
@@ -239,12 +238,12 @@ class ExdirSortingExtractor(SortingExtractor):
                     if group != channel_group:
                         continue
                 if load_waveforms:
-                    if 'Clustering' in channel.keys() and 'EventWaveform' in channel.keys():
+                    if 'Clustering' in channel and 'EventWaveform' in channel:
                         clustering = channel.require_group('Clustering')
                         eventwaveform = channel.require_group('EventWaveform')
                         nums = clustering['nums'].data
                         waveforms = eventwaveform.require_group('waveform_timeseries')['data'].data
-                if 'UnitTimes' in channel.keys():
+                if 'UnitTimes' in channel:
                     for unit, unit_times in channel['UnitTimes'].items():
                         self._unit_ids.append(current_unit)
                         self._spike_trains.append((unit_times['times'].data.rescale('s')*sampling_frequency).magnitude)
@@ -383,7 +382,7 @@ class ExdirSortingExtractor(SortingExtractor):
             # remove preexisten spike sorting data
             max_group = 10
             for chan in np.arange(max_group):
-                if 'channel_group_' + str(chan) in ephys.keys():
+                if 'channel_group_' + str(chan) in ephys:
                     if verbose:
                         print('Removing channel', chan, 'info')
                     ch_group = ephys.require_group('channel_group_' + str(chan))
@@ -54,11 +54,10 @@ class MdaRecordingExtractor(RecordingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = self.get_num_frames()
-        if channel_ids is None:
-            channel_ids = self.get_channel_ids()
+        channel_idxs = self._normalize_channel_ids(channel_ids)
         X = DiskReadMda(self._timeseries_path)
         recordings = X.readChunk(i1=0, i2=start_frame, N1=X.N1(), N2=end_frame - start_frame)
-        recordings = recordings[channel_ids, :]
+        recordings = recordings[channel_idxs, :]
         return recordings
 
     @staticmethod
@@ -49,8 +49,8 @@ class MEArecRecordingExtractor(RecordingExtractor):
         if len(np.array(self._recgen.channel_positions)) == self._num_channels:
             self._locations = np.array(self._recgen.channel_positions)
             if self._locs_2d:
-                if 'electrodes' in self._recgen.info.keys():
-                    if 'plane' in self._recgen.info['electrodes'].keys():
+                if 'electrodes' in self._recgen.info:
+                    if 'plane' in self._recgen.info['electrodes']:
                         probe_plane = self._recgen.info['electrodes']['plane']
                         if probe_plane == 'xy':
                             self._locations = self._locations[:, :2]
@@ -76,17 +76,8 @@ class MEArecRecordingExtractor(RecordingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = self.get_num_frames()
-        if channel_ids is None:
-            channel_ids = list(range(self.get_num_channels()))
-        if np.array(channel_ids).size > 1:
-            if np.any(np.diff(channel_ids) < 0):
-                sorted_idx = np.argsort(channel_ids)
-                recordings = self._recordings[np.sort(channel_ids), start_frame:end_frame]
-                return recordings[sorted_idx]
-            else:
-                return self._recordings[np.array(channel_ids), start_frame:end_frame]
-        else:
-            return self._recordings[np.array(channel_ids), start_frame:end_frame]
+        channel_idxs = self._normalize_channel_ids(channel_ids)
+        return self._read_2d(self._recordings, start_frame, end_frame, channel_idxs)
 
     @staticmethod
     def write_recording(recording, save_path, check_suffix=True):
@@ -41,9 +41,8 @@ class NumpyRecordingExtractor(RecordingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = self.get_num_frames()
-        if channel_ids is None:
-            channel_ids = self.get_channel_ids()
-        recordings = self._timeseries[:, start_frame:end_frame][channel_ids, :]
+        channel_idxs = self._normalize_channel_ids(channel_ids)
+        recordings = self._read_2d(self._timeseries, start_frame, end_frame, channel_idxs)
         return recordings
 
     @staticmethod
@@ -111,6 +110,8 @@ class NumpySortingExtractor(SortingExtractor):
             An array of spike times (in frames).
         '''
         self._units[unit_id] = dict(times=times)
+        self._spike_train_cache = None
+        self._spike_vector = None
 
     def get_unit_ids(self):
         return list(self._units.keys())
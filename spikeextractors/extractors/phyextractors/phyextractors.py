@@ -104,7 +104,7 @@ class PhySortingExtractor(SortingExtractor):
                             property = tokens[1]
                         else:
                             tokens = row[0].split("\t")
-                            if int(tokens[0]) in self.get_unit_ids():
+                            if self._has_unit_id(int(tokens[0])):
                                 if 'cluster_group' in str(f):
                                     self.set_unit_property(int(tokens[0]), 'quality', tokens[1])
                                 elif property == 'chan_grp':
@@ -121,7 +121,7 @@ class PhySortingExtractor(SortingExtractor):
                         if line_count == 0:
                             property = row[1]
                         else:
-                            if int(row[0]) in self.get_unit_ids():
+                            if self._has_unit_id(int(row[0])):
                                 if 'cluster_group' in str(f):
                                     self.set_unit_property(int(row[0]), 'quality', row[1])
                                 elif property == 'chan_grp':
@@ -148,6 +148,7 @@ class PhySortingExtractor(SortingExtractor):
 
         original_units = self._unit_ids
         self._unit_ids = included_units
+        self._invalidate_unit_ids_cache()
         # set features
         self._spiketrains = []
         for clust in self._unit_ids:
@@ -93,13 +93,29 @@ class MultiRecordingTimeExtractor(RecordingExtractor):
     def get_sampling_frequency(self):
         return self._sampling_frequency
 
-    def frame_to_time(self, frame):
-        recording, i_epoch, rel_frame = self._find_section_for_frame(frame)
-        return recording.frame_to_time(rel_frame) + self._start_times[i_epoch]
-
-    def time_to_frame(self, time):
-        recording, i_epoch, rel_time = self._find_section_for_time(time)
-        return recording.time_to_frame(rel_time) + self._start_frames[i_epoch]
+    def frame_to_time(self, frame, out=None):
+        if np.ndim(frame) > 0:
+            # each frame is converted by the recording it falls in
+            time = np.reshape([self.frame_to_time(f) for f in np.ravel(frame)], np.shape(frame))
+        else:
+            recording, i_epoch, rel_frame = self._find_section_for_frame(frame)
+            time = recording.frame_to_time(rel_frame) + self._start_times[i_epoch]
+        if out is not None:
+            np.copyto(out, time)
+            return out
+        return time
+
+    def time_to_frame(self, time, out=None):
+        if np.ndim(time) > 0:
+            # each time is converted by the recording it falls in
+            frame = np.reshape([self.time_to_frame(t) for t in np.ravel(time)], np.shape(time))
+        else:
+            recording, i_epoch, rel_time = self._find_section_for_time(time)
+            frame = recording.time_to_frame(rel_time) + self._start_frames[i_epoch]
+        if out is not None:
+            np.copyto(out, frame)
+            return out
+        return frame
 
 def concatenate_recordings_by_time(recordings, epoch_names=None):
     '''
@@ -28,7 +28,7 @@ class MultiSortingExtractor(SortingExtractor):
             start_frame = 0
         if end_frame is None:
             end_frame = np.Inf
-        if unit_id not in self.get_unit_ids():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
 
         sorting_id = self._unit_map[unit_id]['sorting_id']
@@ -43,14 +43,14 @@ class MultiSortingExtractor(SortingExtractor):
         return self._sortings[0].get_sampling_frequency()
 
     def set_unit_property(self, unit_id, property_name, value):
-        if unit_id not in self._unit_map.keys():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
         sorting_id = self._unit_map[unit_id]['sorting_id']
         unit_id_sorting = self._unit_map[unit_id]['unit_id']
         self._sortings[sorting_id].set_unit_property(unit_id_sorting, property_name, value)
 
     def get_unit_property(self, unit_id, property_name):
-        if unit_id not in self._unit_map.keys():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
         sorting_id = self._unit_map[unit_id]['sorting_id']
         unit_id_sorting = self._unit_map[unit_id]['unit_id']
@@ -63,14 +63,14 @@ class MultiSortingExtractor(SortingExtractor):
         return property_names
 
     def clear_unit_property(self, unit_id, property_name):
-        if unit_id not in self._unit_map.keys():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
         sorting_id = self._unit_map[unit_id]['sorting_id']
         unit_id_sorting = self._unit_map[unit_id]['unit_id']
         self._sortings[sorting_id].clear_unit_property(unit_id_sorting, property_name)
 
     def get_unit_spike_features(self, unit_id, feature_name, start_frame=None, end_frame=None):
-        if unit_id not in self._unit_map.keys():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
         sorting_id = self._unit_map[unit_id]['sorting_id']
         unit_id_sorting = self._unit_map[unit_id]['unit_id']
@@ -78,9 +78,7 @@ class MultiSortingExtractor(SortingExtractor):
 
     def get_unit_spike_feature_names(self, unit_id):
         if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if unit_id not in self._unit_map.keys():
-                    raise ValueError("Non-valid unit_id")
+            if unit_id in self._unit_map:
                 sorting_id = self._unit_map[unit_id]['sorting_id']
                 unit_id_sorting = self._unit_map[unit_id]['unit_id']
                 feature_names = sorted(self._sortings[sorting_id].get_unit_spike_feature_names(unit_id_sorting))
@@ -91,14 +89,14 @@ class MultiSortingExtractor(SortingExtractor):
             raise ValueError("unit_id must be an int")
 
     def set_unit_spike_features(self, unit_id, feature_name, value):
-        if unit_id not in self._unit_map.keys():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
         sorting_id = self._unit_map[unit_id]['sorting_id']
         unit_id_sorting = self._unit_map[unit_id]['unit_id']
         self._sortings[sorting_id].set_unit_spike_features(unit_id_sorting, feature_name, value)
         
     def clear_unit_spike_features(self, unit_id, feature_name):
-        if unit_id not in self._unit_map.keys():
+        if unit_id not in self._unit_map:
             raise ValueError("Non-valid unit_id")
         sorting_id = self._unit_map[unit_id]['sorting_id']
         unit_id_sorting = self._unit_map[unit_id]['unit_id']
@@ -1,20 +1,43 @@
 from abc import ABC, abstractmethod
+import bisect
 import numpy as np
 import copy
 import random
 from .extraction_tools import load_probe_file, save_to_probe_file, write_to_binary_dat_format, get_sub_extractors_by_property
 
+# numba is only imported when get_snippets first needs it (see _import_numba), so that
+# importing spikeextractors does not pay for it. None means not tried yet.
+numba = None
+HAVE_NUMBA = None
+
 class RecordingExtractor(ABC):
     '''A class that contains functions for extracting important information
     from recorded extracellular data. It is an abstract class so all
     functions with the @abstractmethod tag must be implemented for the
     initialization to work.
 
- 
+
     '''
+    # maximum size in bytes of the chunks of traces read at once by get_snippets
+    _snippets_chunk_bytes = 64 * 1024 * 1024
+    # _read_2d reads all channels and selects them in memory if more than this
+    # fraction of the channels is requested
+    _read_2d_channel_fraction = 0.02
+    # get_snippets fills snippets with a parallel numba kernel (if numba is installed) when
+    # extracting at least this many snippets in one call, and with a NumPy loop otherwise
+    _snippets_numba_min = 1000
+    # if not None, get_snippets compiles a kernel specialized for the snippet shape and dtypes
+    # (if numba is installed) when extracting at least this many snippets in one call. Off by
+    # default: the compiled kernels are not cached on disk and are not faster on the strided
+    # trace chunks get_snippets usually reads
+    _snippets_specialize_min = None
+
     def __init__(self):
         self._epochs = {}
+        self._epoch_order = []
         self._channel_properties = {}
+        self._sampling_frequency_cache = None
+        self._traces_dtype = None
         self.id = random.randint(a=0, b=9223372036854775807)
 
     @abstractmethod
@@ -43,13 +66,17 @@ class RecordingExtractor(ABC):
             The ending frame of the trace to be returned (exclusive).
         channel_ids: array_like
             A list or 1D array of channel ids (ints) from which each trace will be
-            extracted.
+            extracted. If None, all channels are returned. Implementations should
+            use _normalize_channel_ids() to get the channel indices, so that reading
+            all channels slices the data instead of fancy indexing it.
 
         Returns
         ----------
         traces: numpy.ndarray
             A 2D array that contains all of the traces from each channel.
-            Dimensions are: (num_channels x num_frames)
+            Dimensions are: (num_channels x num_frames). The array belongs to the
+            caller, who may modify it without changing the recording
+            (_read_2d() copies views of the underlying data).
         '''
         pass
 
@@ -99,39 +126,189 @@ class RecordingExtractor(ABC):
         #       'This warning will be removed in future versions of SpikeInterface.')
         return len(self.get_channel_ids())
 
-    def frame_to_time(self, frame):
+    def get_dtype(self):
+        '''This function returns the dtype of the traces returned by get_traces.
+        The default implementation reads a couple of frames once and caches
+        their dtype.
+
+        Returns
+        -------
+        dtype: numpy.dtype
+            The dtype of the traces.
+        '''
+        if self._traces_dtype is None:
+            end_frame = min(2, self.get_num_frames())
+            self._traces_dtype = np.asarray(self.get_traces(start_frame=0, end_frame=end_frame)).dtype
+        return self._traces_dtype
+
+    def _normalize_channel_ids(self, channel_ids):
+        '''Returns the indices of the given channel ids in get_channel_ids(), to be
+        used to index the traces. If all channels are selected in their default
+        order, slice(None) is returned instead: slicing is a contiguous read, while
+        fancy indexing is much slower on memmap and HDF5 datasets.
+
+        Parameters
+        ----------
+        channel_ids: array_like or int
+            A list or 1D array of channel ids (ints), a single channel id, or None
+            for all channels.
+
+        Returns
+        ----------
+        channel_indices: slice, int or numpy.ndarray
+            slice(None), the index of the single channel (so that a 1D trace is
+            read), or a 1D array with the indices of the channels.
+        '''
+        if channel_ids is None:
+            return slice(None)
+        all_channel_ids = list(self.get_channel_ids())
+        if np.ndim(channel_ids) == 0:
+            if channel_ids not in all_channel_ids:
+                raise ValueError(str(channel_ids) + " is not a valid channel_id")
+            return all_channel_ids.index(channel_ids)
+        if np.array_equal(channel_ids, all_channel_ids):
+            return slice(None)
+        channel_indices = {channel_id: i for i, channel_id in enumerate(all_channel_ids)}
+        try:
+            return np.array([channel_indices[channel_id] for channel_id in channel_ids], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(str(e.args[0]) + " is not a valid channel_id")
+
+    def _read_2d(self, data, start_frame, end_frame, channel_indices, time_axis=1):
+        '''Reads the traces of the given channel indices in [start_frame, end_frame)
+        from a 2D array-like (numpy array, memmap, h5py dataset, ...). Unless only a
+        few channels are requested, the time slab of all channels is read first and
+        the channels are then selected in memory: fancy indexing a memmap or HDF5
+        dataset directly is much slower than a contiguous read.
+
+        Parameters
+        ----------
+        data: array_like
+            The 2D data to read the traces from.
+        start_frame: int
+            The starting frame of the traces to be returned (inclusive).
+        end_frame: int
+            The ending frame of the traces to be returned (exclusive).
+        channel_indices: slice, int or array_like
+            The channel indices (as returned by _normalize_channel_ids) to be read.
+        time_axis: 1 (default) or 0
+            If 1, data has dimensions (num_channels x num_frames).
+            If 0, data has dimensions (num_frames x num_channels).
+
+        Returns
+        ----------
+        traces: numpy.ndarray
+            A new, writable 2D array with the same axis order as data (1D if
+            channel_indices is a single index).
+        '''
+        if isinstance(channel_indices, slice) or np.ndim(channel_indices) == 0:
+            if time_axis == 0:
+                traces = np.asarray(data[start_frame:end_frame, channel_indices])
+            else:
+                traces = np.asarray(data[channel_indices, start_frame:end_frame])
+            # slicing in-memory or memmap data gives a view of the extractor's storage:
+            # callers must get their own writable array, as with fancy indexing
+            if traces.base is not None or not traces.flags.writeable:
+                traces = traces.copy()
+            return traces
+        num_channels = data.shape[1 - time_axis]
+        if len(channel_indices) > self._read_2d_channel_fraction * num_channels:
+            if time_axis == 0:
+                return np.asarray(data[start_frame:end_frame, :])[:, channel_indices]
+            return np.asarray(data[:, start_frame:end_frame])[channel_indices, :]
+        # h5py only supports increasing indices without repetitions
+        unique_indices, inverse = np.unique(channel_indices, return_inverse=True)
+        if time_axis == 0:
+            return np.asarray(data[start_frame:end_frame, unique_indices])[:, inverse]
+        return np.asarray(data[unique_indices, start_frame:end_frame])[inverse, :]
+
+    def get_traces_array(self, channel_ids=None, start_frame=None, end_frame=None, time_axis=1, order=None,
+                         out=None):
+        '''This function returns the traces from get_traces with the requested axis
+        order and memory layout. Traces are only copied if they are not already in
+        the requested layout, so file-backed extractors that store data as
+        (num_frames x num_channels) can be read with time_axis=0 without a transpose copy.
+
+        Parameters
+        ----------
+        channel_ids: array_like
+            A list or 1D array of channel ids (ints) from which each trace will be
+            extracted.
+        start_frame: int
+            The starting frame of the trace to be returned (inclusive).
+        end_frame: int
+            The ending frame of the trace to be returned (exclusive).
+        time_axis: 1 (default) or 0
+            If 1, traces have dimensions (num_channels x num_frames) as in get_traces.
+            If 0, traces have dimensions (num_frames x num_channels).
+        order: None (default), 'C' or 'F'
+            The memory layout of the returned array. If None, the layout returned by
+            get_traces is kept.
+        out: numpy.ndarray
+            If given, the traces are written into this preallocated array, which is
+            returned. Its shape must match the shape of the returned traces.
+
+        Returns
+        ----------
+        traces: numpy.ndarray
+            A 2D array that contains all of the traces from each channel.
+        '''
+        traces = np.asarray(self.get_traces(channel_ids=channel_ids, start_frame=start_frame, end_frame=end_frame))
+        if time_axis == 0:
+            traces = traces.T
+        elif time_axis != 1:
+            raise ValueError("time_axis must be 0 or 1")
+        if out is not None:
+            if out.shape != traces.shape:
+                raise ValueError("out must have shape " + str(traces.shape))
+            np.copyto(out, traces)
+            return out
+        if order is not None:
+            traces = np.asarray(traces, order=order)
+        return traces
+
+    def _get_cached_sampling_frequency(self):
+        if self._sampling_frequency_cache is None:
+            self._sampling_frequency_cache = self.get_sampling_frequency()
+        return self._sampling_frequency_cache
+
+    def frame_to_time(self, frame, out=None):
         '''This function converts a user-inputted frame index to a time with units of seconds.
 
         Parameters
         ----------
-        frame: float
-            The frame to be converted to a time.
+        frame: float or array_like
+            The frame (or frames) to be converted to a time.
+        out: numpy.ndarray
+            If given, the times are written into this preallocated array.
 
         Returns
         -------
-        time: float
+        time: float or numpy.ndarray
             The corresponding time in seconds.
         '''
         # Default implementation
-        return frame / self.get_sampling_frequency()
+        return np.divide(frame, self._get_cached_sampling_frequency(), out=out)
 
-    def time_to_frame(self, time):
+    def time_to_frame(self, time, out=None):
         '''This function converts a user-inputted time (in seconds) to a frame index.
 
         Parameters
         -------
-        time: float
-            The time (in seconds) to be converted to frame index.
+        time: float or array_like
+            The time (or times) in seconds to be converted to frame index.
+        out: numpy.ndarray
+            If given, the frames are written into this preallocated array.
 
         Returns
         -------
-        frame: float
+        frame: float or numpy.ndarray
             The corresponding frame index.
         '''
         # Default implementation
-        return time * self.get_sampling_frequency()
+        return np.multiply(time, self._get_cached_sampling_frequency(), out=out)
 
-    def get_snippets(self, *, reference_frames, snippet_len, channel_ids=None):
+    def get_snippets(self, *, reference_frames, snippet_len, channel_ids=None, out=None):
         '''This function returns data snippets from the given channels that
         are starting on the given frames and are the length of the given snippet
         lengths before and after.
@@ -149,13 +326,18 @@ class RecordingExtractor(ABC):
         channel_ids: array_like
             A list or array of channel ids (ints) from which each trace will be
             extracted.
+        out: numpy.ndarray
+            If given, the snippets are written into this preallocated array, which is
+            returned. Dimensions must be: (len(reference_frames) x num_channels x snippet_len)
+            and its dtype must be one the traces can be cast to ('same_kind' casting).
+            By default, the snippets have the same dtype as the traces (see get_dtype).
 
         Returns
         ----------
         snippets: numpy.ndarray
-            Returns a list of the snippets as numpy arrays.
-            The length of the list is len(reference_frames)
-            Each array has dimensions: (num_channels x snippet_len)
+            Returns the snippets as a single C-contiguous array with dimensions:
+            (len(reference_frames) x num_channels x snippet_len), so snippets[i]
+            is the (num_channels x snippet_len) snippet of the i-th reference frame.
             Out-of-bounds cases should be handled by filling in zeros in the snippet.
         '''
         # Default implementation
@@ -167,37 +349,54 @@ class RecordingExtractor(ABC):
             snippet_len_after = snippet_len - snippet_len_before
 
         if channel_ids is None:
-            channel_ids = self.get_channel_ids()
+            num_channels = self.get_num_channels()
+        else:
+            num_channels = len(channel_ids)
+            # if all channels are requested, let get_traces read them without fancy indexing
+            if isinstance(self._normalize_channel_ids(channel_ids), slice):
+                channel_ids = None
 
         num_snippets = len(reference_frames)
-        num_channels = len(channel_ids)
         num_frames = self.get_num_frames()
         snippet_len_total = snippet_len_before + snippet_len_after
-        # snippets = []
-        snippets = np.zeros((num_snippets, num_channels, snippet_len_total))
-        #TODO extract all waveforms in a chunk
-        pad_first = False
-        pad_last = False
-        pad_samples_first = 0
-        pad_samples_last = 0
-        snippet_idxs = np.array([], dtype=int)
-        for i in range(num_snippets):
-            snippet_chunk = np.zeros((num_channels, snippet_len_total))
-            if (0 <= reference_frames[i]) and (reference_frames[i] < num_frames):
-                snippet_range = np.array(
-                    [int(reference_frames[i]) - snippet_len_before, int(reference_frames[i]) + snippet_len_after])
-                snippet_buffer = np.array([0, snippet_len_total])
-                # The following handles the out-of-bounds cases
-                if snippet_range[0] < 0:
-                    snippet_buffer[0] -= snippet_range[0]
-                    snippet_range[0] -= snippet_range[0]
-                if snippet_range[1] >= num_frames:
-                    snippet_buffer[1] -= snippet_range[1] - num_frames
-                    snippet_range[1] -= snippet_range[1] - num_frames
-                snippet_chunk[:, snippet_buffer[0]:snippet_buffer[1]] = self.get_traces(channel_ids=channel_ids,
-                                                                                        start_frame=snippet_range[0],
-                                                                                        end_frame=snippet_range[1])
-            snippets[i] = snippet_chunk
+        if out is None:
+            snippets = np.zeros((num_snippets, num_channels, snippet_len_total), dtype=self.get_dtype())
+        else:
+            if out.shape != (num_snippets, num_channels, snippet_len_total):
+                raise ValueError("out must have shape " + str((num_snippets, num_channels, snippet_len_total)))
+            if not np.can_cast(self.get_dtype(), out.dtype, casting='same_kind'):
+                raise ValueError("out must have a dtype that " + str(self.get_dtype()) + " traces can be cast to")
+            snippets = out
+            snippets.fill(0)
+
+        # Snippets are only extracted for reference frames within the recording. For each of them,
+        # [start, end) is the frame range read from the traces and [buffer_start, buffer_end) the range
+        # it fills in the snippet, the rest being zero-padded for out-of-bounds cases
+        frames = np.asarray(reference_frames, dtype=np.int64)
+        valid_idxs = np.flatnonzero((frames >= 0) & (frames < num_frames))
+        if len(valid_idxs) == 0:
+            return snippets
+        raw_start = frames[valid_idxs] - snippet_len_before
+        start = np.clip(raw_start, 0, num_frames)
+        end = np.clip(frames[valid_idxs] + snippet_len_after, 0, num_frames)
+        buffer_start = start - raw_start
+        buffer_end = buffer_start + end - start
+
+        use_numba = len(valid_idxs) >= self._snippets_numba_min
+        specialize = self._snippets_specialize_min is not None and \
+            len(valid_idxs) >= self._snippets_specialize_min
+        # Overlapping or nearby snippets are extracted from a single chunk of traces. The chunk size
+        # is bounded for all channels, since get_traces may read every channel before selecting
+        max_chunk_frames = max(self._snippets_chunk_bytes // (max(self.get_num_channels(), 1) *
+                                                              self.get_dtype().itemsize),
+                               snippet_len_total)
+        for chunk_start, chunk_end, chunk_idxs in _get_snippet_chunks(start, end, snippet_len_total,
+                                                                      max_chunk_frames):
+            traces = np.asarray(self.get_traces(channel_ids=channel_ids, start_frame=chunk_start,
+                                                end_frame=chunk_end))
+            _fill_snippets(snippets, traces, valid_idxs[chunk_idxs], start[chunk_idxs] - chunk_start,
+                           buffer_start[chunk_idxs], end[chunk_idxs] - start[chunk_idxs],
+                           use_numba=use_numba, specialize=specialize)
         return snippets
 
     def set_channel_locations(self, channel_ids, locations):
@@ -387,7 +586,7 @@ class RecordingExtractor(ABC):
                 if channel_id not in self._channel_properties:
                     self._channel_properties[channel_id] = {}
                 if isinstance(property_name, str):
-                    if property_name in list(self._channel_properties[channel_id].keys()):
+                    if property_name in self._channel_properties[channel_id]:
                         return self._channel_properties[channel_id][property_name]
                     else:
                         raise RuntimeError(str(property_name) + " has not been added to channel " + str(channel_id))
@@ -514,10 +713,14 @@ class RecordingExtractor(ABC):
         '''
         # Default implementation only allows for frame info. Can override to put more info
         if isinstance(epoch_name, str):
+            if epoch_name in self._epochs:
+                self._remove_epoch_order(epoch_name)
             if end_frame == np.inf:
                 self._epochs[epoch_name] = {'start_frame': int(start_frame), 'end_frame': end_frame}
             else:
                 self._epochs[epoch_name] = {'start_frame': int(start_frame), 'end_frame': int(end_frame)}
+            # epochs are kept sorted by start frame
+            bisect.insort(self._epoch_order, (int(start_frame), epoch_name))
         else:
             raise TypeError("epoch_name must be a string")
 
@@ -530,7 +733,8 @@ class RecordingExtractor(ABC):
             The name of the epoch to be removed
         '''
         if isinstance(epoch_name, str):
-            if epoch_name in list(self._epochs.keys()):
+            if epoch_name in self._epochs:
+                self._remove_epoch_order(epoch_name)
                 del self._epochs[epoch_name]
             else:
                 raise RuntimeError("This epoch has not been added")
@@ -545,18 +749,13 @@ class RecordingExtractor(ABC):
         epoch_names: list
             List of epoch names in the recording extractor
         '''
-        epoch_names = list(self._epochs.keys())
-        if not epoch_names:
-            pass
-        else:
-            epoch_start_frames = []
-            for epoch_name in epoch_names:
-                epoch_info = self.get_epoch_info(epoch_name)
-                start_frame = epoch_info['start_frame']
-                epoch_start_frames.append(start_frame)
-            epoch_names = [epoch_name for _, epoch_name in sorted(zip(epoch_start_frames, epoch_names))]
+        epoch_names = [epoch_name for _, epoch_name in self._epoch_order]
         return epoch_names
 
+    def _remove_epoch_order(self, epoch_name):
+        idx = bisect.bisect_left(self._epoch_order, (self._epochs[epoch_name]['start_frame'], epoch_name))
+        del self._epoch_order[idx]
+
     def get_epoch_info(self, epoch_name):
         '''This function returns the start frame and end frame of the epoch
         in a dict.
@@ -573,7 +772,7 @@ class RecordingExtractor(ABC):
         '''
         # Default (Can add more information into each epoch in subclass)
         if isinstance(epoch_name, str):
-            if epoch_name in list(self._epochs.keys()):
+            if epoch_name in self._epochs:
                 epoch_info = self._epochs[epoch_name]
                 return epoch_info
             else:
@@ -714,3 +913,111 @@ class RecordingExtractor(ABC):
         '''
         raise NotImplementedError("The write_recording function is not \
                                   implemented for this extractor")
+
+
+def _get_snippet_chunks(start, end, max_gap, max_chunk_frames):
+    '''Groups snippets with frame ranges [start, end) into chunks of traces to be read at once.
+    Snippets are sorted by start frame and added to the current chunk if they are at most max_gap
+    frames away from it and the chunk stays within max_chunk_frames.
+
+    Returns
+    ----------
+    chunks: list
+        List of (chunk_start, chunk_end, snippet_idxs) tuples.
+    '''
+    chunks = []
+    order = np.argsort(start, kind='stable')
+    chunk_first = 0
+    chunk_start = start[order[0]]
+    chunk_end = end[order[0]]
+    for k in range(1, len(order)):
+        j = order[k]
+        if start[j] <= chunk_end + max_gap and max(chunk_end, end[j]) - chunk_start <= max_chunk_frames:
+            chunk_end = max(chunk_end, end[j])
+        else:
+            chunks.append((chunk_start, chunk_end, order[chunk_first:k]))
+            chunk_first = k
+            chunk_start = start[j]
+            chunk_end = end[j]
+    chunks.append((chunk_start, chunk_end, order[chunk_first:]))
+    return chunks
+
+
+def _fill_snippets(snippets, traces, snippet_idxs, traces_start, buffer_start, lengths, use_numba=False,
+                   specialize=False):
+    '''Copies traces[:, traces_start[k]:traces_start[k] + lengths[k]] into
+    snippets[snippet_idxs[k], :, buffer_start[k]:buffer_start[k] + lengths[k]] for each k.
+    If use_numba is True, the copy runs in parallel with numba if it is installed and supports
+    the dtypes. If specialize is also True, a kernel compiled for the snippet shape and dtypes
+    is used (compiled on first use).
+    '''
+    if use_numba and snippets.dtype in _numba_dtypes and traces.dtype in _numba_dtypes and _import_numba():
+        if specialize:
+            kernel = _get_fill_snippets_kernel(snippets, traces)
+            kernel(snippets, traces, *[np.ascontiguousarray(idxs, dtype=np.int64)
+                                       for idxs in [snippet_idxs, traces_start, buffer_start, lengths]])
+        else:
+            _get_fill_snippets_kernel()(snippets, traces, snippet_idxs, traces_start, buffer_start, lengths)
+    else:
+        for k in range(len(snippet_idxs)):
+            snippets[snippet_idxs[k], :, buffer_start[k]:buffer_start[k] + lengths[k]] = \
+                traces[:, traces_start[k]:traces_start[k] + lengths[k]]
+
+
+def _import_numba():
+    '''Imports numba on first call and returns True if it is installed.
+    '''
+    global numba, HAVE_NUMBA
+    if HAVE_NUMBA is None:
+        try:
+            import numba
+            HAVE_NUMBA = True
+        except ImportError:
+            HAVE_NUMBA = False
+    return HAVE_NUMBA
+
+
+_numba_dtypes = {np.dtype(dtype) for dtype in [np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16,
+                                               np.uint32, np.uint64, np.float32, np.float64]}
+# compiled kernels: None for the generic one, else keyed by snippet shape and array types
+_fill_snippets_kernels = {}
+
+
+def _fill_snippets_parallel(snippets, traces, snippet_idxs, traces_start, buffer_start, lengths):
+    # compiled by _get_fill_snippets_kernel once numba is imported
+    for k in numba.prange(len(snippet_idxs)):
+        snippets[snippet_idxs[k], :, buffer_start[k]:buffer_start[k] + lengths[k]] = \
+            traces[:, traces_start[k]:traces_start[k] + lengths[k]]
+
+
+def _get_fill_snippets_kernel(snippets=None, traces=None):
+    '''Returns the generic parallel kernel if no arrays are given. Otherwise, returns a kernel
+    compiled for the snippet shape and the snippets/traces types, so that the channel count and
+    snippet length are compile-time constants and full-length snippets are copied with a fixed
+    trip count. Requires numba to be imported (see _import_numba).
+    '''
+    if snippets is None:
+        if None not in _fill_snippets_kernels:
+            _fill_snippets_kernels[None] = numba.njit(parallel=True, cache=True)(_fill_snippets_parallel)
+        return _fill_snippets_kernels[None]
+    num_channels, snippet_len = snippets.shape[1], snippets.shape[2]
+    # the numba types carry dtype, layout and writability of the arrays
+    snippets_type, traces_type = numba.typeof(snippets), numba.typeof(traces)
+    key = (snippet_len, num_channels, snippets_type, traces_type)
+    if key not in _fill_snippets_kernels:
+        index_type = numba.int64[::1]
+        signature = numba.void(snippets_type, traces_type, index_type, index_type, index_type, index_type)
+
+        @numba.njit(signature, parallel=True)
+        def kernel(snippets, traces, snippet_idxs, traces_start, buffer_start, lengths):
+            for k in numba.prange(len(snippet_idxs)):
+                i, t0, b0 = snippet_idxs[k], traces_start[k], buffer_start[k]
+                if lengths[k] == snippet_len:
+                    for c in range(num_channels):
+                        snippets[i, c, :] = traces[c, t0:t0 + snippet_len]
+                else:
+                    for c in range(num_channels):
+                        snippets[i, c, b0:b0 + lengths[k]] = traces[c, t0:t0 + lengths[k]]
+
+        _fill_snippets_kernels[key] = kernel
+    return _fill_snippets_kernels[key]
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import bisect
+from collections import defaultdict
 import numpy as np
 import copy
 from .extraction_tools import get_sub_extractors_by_property
@@ -15,9 +17,13 @@ class SortingExtractor(ABC):
     '''
     def __init__(self):
         self._epochs = {}
-        self._unit_properties = {}
+        self._epoch_order = []
+        self._unit_properties = defaultdict(dict)
         self._unit_features = {}
         self._sampling_frequency = None
+        self._unit_ids_set = None
+        self._spike_train_cache = None
+        self._spike_vector = None
         self.id = np.random.randint(low=0, high=9223372036854775807)
 
     @abstractmethod
@@ -63,6 +69,94 @@ class SortingExtractor(ABC):
         '''
         pass
 
+    def precompute_spike_trains(self):
+        '''This function loads the spike train of every unit once and keeps it
+        in memory as a sorted int64 array, so that get_unit_spike_train_cached
+        can answer frame range queries with a binary search instead of
+        re-filtering the full spike train.
+        '''
+        self._spike_train_cache = {
+            unit_id: np.sort(np.asarray(self.get_unit_spike_train(unit_id), dtype=np.int64))
+            for unit_id in self.get_unit_ids()
+        }
+
+    def get_unit_spike_train_cached(self, unit_id, start_frame=None, end_frame=None):
+        '''This function returns the same spike frames as get_unit_spike_train, but uses
+        the spike trains stored by precompute_spike_trains if available. Falls back to
+        get_unit_spike_train if the spike trains have not been precomputed.
+
+        Parameters
+        ----------
+        unit_id: int
+            The id that specifies a unit in the recording.
+        start_frame: int
+            The frame above which a spike frame is returned  (inclusive).
+        end_frame: int
+            The frame below which a spike frame is returned  (exclusive).
+        Returns
+        ----------
+        spike_train: numpy.ndarray
+            An 1D array containing all the frames for each spike in the
+            specified unit given the range of start and end frames.
+        '''
+        if self._spike_train_cache is None or unit_id not in self._spike_train_cache:
+            return self.get_unit_spike_train(unit_id, start_frame=start_frame, end_frame=end_frame)
+        spike_train = self._spike_train_cache[unit_id]
+        lo = 0 if start_frame is None else np.searchsorted(spike_train, start_frame)
+        hi = len(spike_train) if end_frame is None else np.searchsorted(spike_train, end_frame)
+        return spike_train[lo:hi]
+
+    def to_spike_vector(self, use_cache=True):
+        '''This function returns the spikes of all units as a single structured
+        array sorted by frame. The 'unit_ind' field is the index of the unit in
+        get_unit_ids(); spikes at the same frame are ordered by unit index.
+
+        Parameters
+        ----------
+        use_cache: bool
+            If True (default), the spike vector is computed once and reused.
+
+        Returns
+        ----------
+        spike_vector: numpy.ndarray
+            Structured array with fields 'sample_ind' (int64) and 'unit_ind' (int32).
+        '''
+        if use_cache and self._spike_vector is not None:
+            return self._spike_vector
+        spike_trains = [self.get_unit_spike_train_cached(unit_id) for unit_id in self.get_unit_ids()]
+        spike_vector = np.empty(sum(len(st) for st in spike_trains),
+                                dtype=[('sample_ind', '<i8'), ('unit_ind', '<i4')])
+        pos = 0
+        for unit_ind, st in enumerate(spike_trains):
+            spike_vector['sample_ind'][pos:pos + len(st)] = st
+            spike_vector['unit_ind'][pos:pos + len(st)] = unit_ind
+            pos += len(st)
+        spike_vector = spike_vector[np.argsort(spike_vector['sample_ind'], kind='stable')]
+        if use_cache:
+            self._spike_vector = spike_vector
+        return spike_vector
+
+    def _get_unit_ids_set(self):
+        '''Returns a cached set of the unit ids, used to validate unit ids
+        without calling get_unit_ids() every time.
+        '''
+        if self._unit_ids_set is None:
+            self._unit_ids_set = frozenset(self.get_unit_ids())
+        return self._unit_ids_set
+
+    def _invalidate_unit_ids_cache(self):
+        '''Clears the cached set of unit ids. Subclasses that remove or rename
+        units after initialization must call this.
+        '''
+        self._unit_ids_set = None
+
+    def _has_unit_id(self, unit_id):
+        if unit_id in self._get_unit_ids_set():
+            return True
+        # the unit may have been added after the cache was built
+        self._invalidate_unit_ids_cache()
+        return unit_id in self._get_unit_ids_set()
+
     def get_sampling_frequency(self):
         '''
         It returns the sampling frequency.
@@ -98,8 +192,8 @@ class SortingExtractor(ABC):
             formats as specified by the user.
         '''
         if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if unit_id not in self._unit_features.keys():
+            if self._has_unit_id(unit_id):
+                if unit_id not in self._unit_features:
                     self._unit_features[unit_id] = {}
                 if isinstance(feature_name, str) and len(value) == len(self.get_unit_spike_train(unit_id)):
                     self._unit_features[unit_id][feature_name] = np.asarray(value)
@@ -145,11 +239,11 @@ class SortingExtractor(ABC):
             specified unit given the range of start and end frames.
         '''
         if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if unit_id not in self._unit_features.keys():
+            if self._has_unit_id(unit_id):
+                if unit_id not in self._unit_features:
                     self._unit_features[unit_id] = {}
                 if isinstance(feature_name, str):
-                    if feature_name in self._unit_features[unit_id].keys():
+                    if feature_name in self._unit_features[unit_id]:
                         spike_train = self.get_unit_spike_train(unit_id)
                         if start_frame is None:
                             start_frame = 0
@@ -207,7 +301,7 @@ class SortingExtractor(ABC):
             The list of feature names.
         '''
         if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
+            if self._has_unit_id(unit_id):
                 if unit_id not in self._unit_features:
                     self._unit_features[unit_id] = {}
                 feature_names = sorted(self._unit_features[unit_id].keys())
@@ -252,18 +346,29 @@ class SortingExtractor(ABC):
             The data associated with the given property name. Could be many
             formats as specified by the user.
         '''
-        if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if unit_id not in self._unit_properties:
-                    self._unit_properties[unit_id] = {}
-                if isinstance(property_name, str):
-                    self._unit_properties[unit_id][property_name] = value
-                else:
-                    raise ValueError(str(property_name) + " must be a string")
-            else:
-                raise ValueError(str(unit_id) + " is not a valid unit_id")
-        else:
+        self._check_unit_id(unit_id)
+        if not isinstance(property_name, str):
+            raise ValueError(str(property_name) + " must be a string")
+        self._set_unit_property_fast(unit_id, property_name, value)
+
+    def _set_unit_property_fast(self, unit_id, property_name, value):
+        # no validation: callers must have checked unit_id and property_name
+        self._unit_properties[unit_id][property_name] = value
+
+    def _get_unit_property_setter(self):
+        '''Returns the function used by bulk setters to store unit properties once
+        they have checked the unit ids and property name: _set_unit_property_fast,
+        unless a subclass overrides set_unit_property, which is then always used.
+        '''
+        if type(self).set_unit_property is SortingExtractor.set_unit_property:
+            return self._set_unit_property_fast
+        return self.set_unit_property
+
+    def _check_unit_id(self, unit_id):
+        if not isinstance(unit_id, (int, np.integer)):
             raise ValueError(str(unit_id) + " must be an int")
+        if not self._has_unit_id(unit_id):
+            raise ValueError(str(unit_id) + " is not a valid unit_id")
 
     def set_units_property(self, *, unit_ids=None, property_name, values):
         '''Sets unit property data for a list of units
@@ -280,8 +385,12 @@ class SortingExtractor(ABC):
         '''
         if unit_ids is None:
             unit_ids = self.get_unit_ids()
+        if not isinstance(property_name, str):
+            raise ValueError(str(property_name) + " must be a string")
+        set_unit_property = self._get_unit_property_setter()
         for i, unit in enumerate(unit_ids):
-            self.set_unit_property(unit_id=unit, property_name=property_name, value=values[i])
+            self._check_unit_id(unit)
+            set_unit_property(unit, property_name, values[i])
 
     def add_unit_property(self, unit_id, property_name, value):
         '''DEPRECATED! This function adds a unit property data set under the given property
@@ -298,16 +407,7 @@ class SortingExtractor(ABC):
             formats as specified by the user.
         '''
         print('WARNING: add_unit_property is deprecated. Use set_unit_property instead.')
-        if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if isinstance(property_name, str):
-                    self._unit_properties[unit_id][property_name] = value
-                else:
-                    raise ValueError(str(property_name) + " must be a string")
-            else:
-                raise ValueError(str(unit_id) + " is not a valid unit_id")
-        else:
-            raise ValueError(str(unit_id) + " must be an int")
+        self.set_unit_property(unit_id, property_name, value)
 
     def get_unit_property(self, unit_id, property_name):
         '''This function rerturns the data stored under the property name given
@@ -326,11 +426,9 @@ class SortingExtractor(ABC):
             formats as specified by the user.
         '''
         if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if unit_id not in self._unit_properties:
-                    self._unit_properties[unit_id] = {}
+            if self._has_unit_id(unit_id):
                 if isinstance(property_name, str):
-                    if property_name in list(self._unit_properties[unit_id].keys()):
+                    if property_name in self._unit_properties[unit_id]:
                         return self._unit_properties[unit_id][property_name]
                     else:
                         raise ValueError(str(property_name) + " has not been added to unit " + str(unit_id))
@@ -374,9 +472,7 @@ class SortingExtractor(ABC):
             The list of property names
         '''
         if isinstance(unit_id, (int, np.integer)):
-            if unit_id in self.get_unit_ids():
-                if unit_id not in self._unit_properties:
-                    self._unit_properties[unit_id] = {}
+            if self._has_unit_id(unit_id):
                 property_names = sorted(self._unit_properties[unit_id].keys())
                 return property_names
             else:
@@ -418,17 +514,20 @@ class SortingExtractor(ABC):
         '''
         if unit_ids is None:
             unit_ids = sorting.get_unit_ids()
+        set_unit_property = self._get_unit_property_setter()
         if isinstance(unit_ids, int):
             curr_property_names = sorting.get_unit_property_names(unit_id=unit_ids)
+            self._check_unit_id(unit_ids)
             for curr_property_name in curr_property_names:
                 value = sorting.get_unit_property(unit_id=unit_ids, property_name=curr_property_name)
-                self.set_unit_property(unit_id=unit_ids, property_name=curr_property_name, value=value)
+                set_unit_property(unit_ids, curr_property_name, value)
         else:
             for unit_id in unit_ids:
                 curr_property_names = sorting.get_unit_property_names(unit_id=unit_id)
+                self._check_unit_id(unit_id)
                 for curr_property_name in curr_property_names:
                     value = sorting.get_unit_property(unit_id=unit_id, property_name=curr_property_name)
-                    self.set_unit_property(unit_id=unit_id, property_name=curr_property_name, value=value)
+                    set_unit_property(unit_id, curr_property_name, value)
 
     def clear_unit_property(self, unit_id, property_name):
         '''This function clears the unit property for the given property.
@@ -502,10 +601,14 @@ class SortingExtractor(ABC):
         '''
         # Default implementation only allows for frame info. Can override to put more info
         if isinstance(epoch_name, str):
+            if epoch_name in self._epochs:
+                self._remove_epoch_order(epoch_name)
             if end_frame == np.inf:
                 self._epochs[epoch_name] = {'start_frame': int(start_frame), 'end_frame': end_frame}
             else:
                 self._epochs[epoch_name] = {'start_frame': int(start_frame), 'end_frame': int(end_frame)}
+            # epochs are kept sorted by start frame
+            bisect.insort(self._epoch_order, (int(start_frame), epoch_name))
         else:
             raise ValueError("epoch_name must be a string")
 
@@ -518,7 +621,8 @@ class SortingExtractor(ABC):
             The name of the epoch to be removed
         '''
         if isinstance(epoch_name, str):
-            if epoch_name in list(self._epochs.keys()):
+            if epoch_name in self._epochs:
+                self._remove_epoch_order(epoch_name)
                 del self._epochs[epoch_name]
             else:
                 raise ValueError("This epoch has not been added")
@@ -533,18 +637,13 @@ class SortingExtractor(ABC):
         epoch_names: list
             List of epoch names in the recording extractor
         '''
-        epoch_names = list(self._epochs.keys())
-        if not epoch_names:
-            pass
-        else:
-            epoch_start_frames = []
-            for epoch_name in epoch_names:
-                epoch_info = self.get_epoch_info(epoch_name)
-                start_frame = epoch_info['start_frame']
-                epoch_start_frames.append(start_frame)
-            epoch_names = [epoch_name for _, epoch_name in sorted(zip(epoch_start_frames, epoch_names))]
+        epoch_names = [epoch_name for _, epoch_name in self._epoch_order]
         return epoch_names
 
+    def _remove_epoch_order(self, epoch_name):
+        idx = bisect.bisect_left(self._epoch_order, (self._epochs[epoch_name]['start_frame'], epoch_name))
+        del self._epoch_order[idx]
+
     def get_epoch_info(self, epoch_name):
         '''This function returns the start frame and end frame of the epoch
         in a dict.
@@ -561,7 +660,7 @@ class SortingExtractor(ABC):
         '''
         # Default (Can add more information into each epoch in subclass)
         if isinstance(epoch_name, str):
-            if epoch_name in list(self._epochs.keys()):
+            if epoch_name in self._epochs:
                 epoch_info = self._epochs[epoch_name]
                 return epoch_info
             else:
@@ -51,26 +51,29 @@ class SubRecordingExtractor(RecordingExtractor):
     def get_sampling_frequency(self):
         return self._parent_recording.get_sampling_frequency()
 
-    def frame_to_time(self, frame):
-        frame2 = frame + self._start_frame
+    def get_dtype(self):
+        return self._parent_recording.get_dtype()
+
+    def frame_to_time(self, frame, out=None):
+        frame2 = np.add(frame, self._start_frame)
         time1 = self._parent_recording.frame_to_time(frame2)
-        time2 = time1 - self._parent_recording.frame_to_time(self._start_frame)
+        time2 = np.subtract(time1, self._parent_recording.frame_to_time(self._start_frame), out=out)
         return time2
 
-    def time_to_frame(self, time):
-        time2 = time + self._parent_recording.frame_to_time(self._start_frame)
+    def time_to_frame(self, time, out=None):
+        time2 = np.add(time, self._parent_recording.frame_to_time(self._start_frame))
         frame1 = self._parent_recording.time_to_frame(time2)
-        frame2 = frame1 - self._start_frame
+        frame2 = np.subtract(frame1, self._start_frame, out=out)
         return frame2
 
-    def get_snippets(self, *, reference_frames, snippet_len, channel_ids=None):
+    def get_snippets(self, *, reference_frames, snippet_len, channel_ids=None, out=None):
         if channel_ids is None:
             channel_ids = self.get_channel_ids()
         reference_frames_shift = self._start_frame + np.array(reference_frames)
         original_ch_ids = []
         original_ch_ids = self.get_original_channel_ids(channel_ids)
         return self._parent_recording.get_snippets(reference_frames=reference_frames_shift, snippet_len=snippet_len,
-                                                   channel_ids=original_ch_ids)
+                                                   channel_ids=original_ch_ids, out=out)
 
     def copy_channel_properties(self, recording, channel_ids=None):
         if channel_ids is None:
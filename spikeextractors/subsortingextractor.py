@@ -36,7 +36,7 @@ class SubSortingExtractor(SortingExtractor):
         if end_frame is None:
             end_frame = np.Inf
         if (isinstance(unit_id, (int, np.integer))):
-            if (unit_id in self.get_unit_ids()):
+            if self._has_unit_id(unit_id):
                 original_unit_id = self._original_unit_id_lookup[unit_id]
             else:
                 raise ValueError("Non-valid unit_id")
@@ -57,23 +57,26 @@ class SubSortingExtractor(SortingExtractor):
     def copy_unit_properties(self, sorting, unit_ids=None):
         if unit_ids is None:
             unit_ids = self.get_unit_ids()
+        set_unit_property = self._get_unit_property_setter()
         if isinstance(unit_ids, int):
             sorting_unit_id = unit_ids
             if sorting is self._parent_sorting:
                 sorting_unit_id = self.get_original_unit_ids(unit_ids)
             curr_property_names = sorting.get_unit_property_names(unit_id=sorting_unit_id)
+            self._check_unit_id(unit_ids)
             for curr_property_name in curr_property_names:
                 value = sorting.get_unit_property(unit_id=sorting_unit_id, property_name=curr_property_name)
-                self.set_unit_property(unit_id=unit_ids, property_name=curr_property_name, value=value)
+                set_unit_property(unit_ids, curr_property_name, value)
         else:
             for unit_id in unit_ids:
                 sorting_unit_id = unit_id
                 if sorting is self._parent_sorting:
                     sorting_unit_id = self.get_original_unit_ids(unit_id)
                 curr_property_names = sorting.get_unit_property_names(unit_id=sorting_unit_id)
+                self._check_unit_id(unit_id)
                 for curr_property_name in curr_property_names:
                     value = sorting.get_unit_property(unit_id=sorting_unit_id, property_name=curr_property_name)
-                    self.set_unit_property(unit_id=unit_id, property_name=curr_property_name, value=value)
+                    set_unit_property(unit_id, curr_property_name, value)
 
     def copy_unit_spike_features(self, sorting, unit_ids=None, start_frame=None, end_frame=None):
         if unit_ids is None:
@@ -98,7 +101,7 @@ class SubSortingExtractor(SortingExtractor):
 
     def get_original_unit_ids(self, unit_ids):
         if isinstance(unit_ids, (int, np.integer)):
-            if unit_ids in self.get_unit_ids():
+            if self._has_unit_id(unit_ids):
                 original_unit_ids = self._original_unit_id_lookup[unit_ids]
             else:
                 raise ValueError("Non-valid unit_id")
@@ -106,7 +109,7 @@ class SubSortingExtractor(SortingExtractor):
             original_unit_ids = []
             for unit_id in unit_ids:
                 if isinstance(unit_id, (int, np.integer)):
-                    if unit_id in self.get_unit_ids():
+                    if self._has_unit_id(unit_id):
                         original_unit_id = self._original_unit_id_lookup[unit_id]
                         original_unit_ids.append(original_unit_id)
                     else:
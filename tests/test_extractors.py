@@ -85,6 +85,16 @@ class TestExtractors(unittest.TestCase):
                          self.example_info['channel_prop'])
         self.assertEqual(self.SX.get_unit_property(unit_id=1, property_name='stability'),
                          self.example_info['unit_prop'])
+        self.SX.add_unit_property(unit_id=2, property_name='stability', value=70)
+        self.assertEqual(self.SX.get_unit_property(unit_id=2, property_name='stability'), 70)
+        self.SX.set_units_property(property_name='quality', values=['good', 'bad', 'good'])
+        self.assertEqual(self.SX.get_unit_property(unit_id=2, property_name='quality'), 'bad')
+        self.assertRaises(ValueError, self.SX.set_units_property, unit_ids=[1, 10], property_name='quality',
+                          values=['good', 'bad'])
+        SX_multi = se.MultiSortingExtractor(sortings=[self.SX, self.SX2])
+        SX_multi.set_units_property(unit_ids=[1], property_name='multi_prop', values=[3])
+        self.assertEqual(SX_multi.get_unit_property(unit_id=1, property_name='multi_prop'), 3)
+        self.assertTrue('multi_prop' not in SX_multi._unit_properties[1])
         self.assertTrue(np.array_equal(self.SX.get_unit_spike_train(1), self.example_info['train1']))
         self.assertTrue(issubclass(self.SX.get_unit_spike_train(1).dtype.type, np.integer))
         self.assertTrue(self.RX.get_shared_channel_property_names(), ['shared_channel_prop'])
@@ -108,6 +118,18 @@ class TestExtractors(unittest.TestCase):
 
         self._check_recording_return_types(self.RX)
 
+    def test_epochs(self):
+        for extractor in [self.RX, self.SX]:
+            extractor.add_epoch('b', 100, 200)
+            extractor.add_epoch('a', 300, 400)
+            extractor.add_epoch('c', 0, 100)
+            self.assertEqual(extractor.get_epoch_names(), ['c', 'b', 'a'])
+            extractor.add_epoch('c', 500, 600)
+            self.assertEqual(extractor.get_epoch_names(), ['b', 'a', 'c'])
+            extractor.remove_epoch('a')
+            self.assertEqual(extractor.get_epoch_names(), ['b', 'c'])
+            self.assertEqual(extractor.get_epoch_info('c'), {'start_frame': 500, 'end_frame': 600})
+
     def test_cache_extractor(self):
         cache_extractor = se.CacheRecordingExtractor(self.RX)
         self._check_recording_return_types(cache_extractor)
@@ -213,6 +235,13 @@ class TestExtractors(unittest.TestCase):
         RX_sub = RX_multi.get_epoch('C')
         self._check_recordings_equal(self.RX, RX_sub)
         self.assertEqual(4, len(RX_sub.get_channel_ids()))
+        N = self.RX.get_num_frames()
+        frames = np.array([0, N - 1, N, 2 * N + 5])
+        out = np.empty(len(frames))
+        self.assertTrue(RX_multi.frame_to_time(frames, out=out) is out)
+        self.assertTrue(np.allclose(out, frames / self.RX.get_sampling_frequency()))
+        self.assertTrue(np.allclose(RX_multi.time_to_frame(out), frames))
+        self.assertTrue(np.allclose(RX_sub.frame_to_time(frames[:2]), frames[:2] / self.RX.get_sampling_frequency()))
 
         RX_multi = se.MultiRecordingChannelExtractor(
             recordings=[self.RX, self.RX2, self.RX3],
@@ -37,14 +37,76 @@ class TestNumpyExtractors(unittest.TestCase):
         self.assertTrue(np.allclose(self.RX.get_traces(), self._X))
         self.assertTrue(
             np.allclose(self.RX.get_traces(channel_ids=[0, 3], start_frame=0, end_frame=12), self._X[[0, 3], 0:12]))
+        traces = self.RX.get_traces()
+        traces -= 1000
+        self.assertTrue(np.allclose(self.RX.get_traces(), self._X))
+        self.assertEqual(self.RX._normalize_channel_ids([0, 1, 2, 3]), slice(None))
+        self.assertTrue(np.array_equal(self.RX.get_traces(channel_ids=2, start_frame=5, end_frame=15),
+                                       self._X[2, 5:15]))
+        self.assertRaises(ValueError, self.RX.get_traces, channel_ids=10)
+        self.assertTrue(np.array_equal(self.RX._normalize_channel_ids([3, 1]), [3, 1]))
+        # _read_2d reads either the full time slab or only the requested channels
+        for fraction in [0, 1]:
+            self.RX._read_2d_channel_fraction = fraction
+            self.assertTrue(np.array_equal(self.RX._read_2d(self._X, 5, 15, [3, 1, 1]), self._X[[3, 1, 1], 5:15]))
+            self.assertTrue(np.array_equal(self.RX._read_2d(self._X.T, 5, 15, [3, 1, 1], time_axis=0),
+                                           self._X[[3, 1, 1], 5:15].T))
+        # get_traces_array
+        self.assertTrue(np.allclose(self.RX.get_traces_array(time_axis=0, start_frame=0, end_frame=12),
+                                    self._X[:, 0:12].T))
+        self.assertTrue(self.RX.get_traces_array(time_axis=0, order='C').flags['C_CONTIGUOUS'])
+        self.assertTrue(self.RX.get_traces_array(order='F').flags['F_CONTIGUOUS'])
         # get_channel_property - location
         self.assertTrue(np.allclose(np.array(self.RX.get_channel_property(1, 'location')), self._geom[1, :]))
         # time_to_frame / frame_to_time
         self.assertEqual(self.RX.time_to_frame(12), 12 * self.RX.get_sampling_frequency())
         self.assertEqual(self.RX.frame_to_time(12), 12 / self.RX.get_sampling_frequency())
+        frames = np.arange(0, 100, 7)
+        self.assertTrue(np.array_equal(self.RX.frame_to_time(frames), frames / self.RX.get_sampling_frequency()))
+        out = np.empty(len(frames))
+        self.assertTrue(self.RX.frame_to_time(frames, out=out) is out)
+        self.assertTrue(np.allclose(self.RX.time_to_frame(out), frames))
         # get_snippets
         snippets = self.RX.get_snippets(reference_frames=[0, 30, 50], snippet_len=20)
+        self.assertEqual(snippets.shape, (3, self._X.shape[0], 20))
+        self.assertTrue(snippets.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.allclose(snippets[1], self._X[:, 20:40]))
+        self.assertTrue(np.allclose(snippets[0][:, 10:], self._X[:, :10]))
+        self.assertTrue(np.allclose(snippets[0][:, :10], 0))
+        snippets = self.RX.get_snippets(reference_frames=[-5, 30, 5000, 9995], snippet_len=20)
+        self.assertTrue(np.allclose(snippets[0], 0))
         self.assertTrue(np.allclose(snippets[1], self._X[:, 20:40]))
+        self.assertTrue(np.allclose(snippets[2], self._X[:, 4990:5010]))
+        self.assertTrue(np.allclose(snippets[3][:, :15], self._X[:, 9985:]))
+        self.assertTrue(np.allclose(snippets[3][:, 15:], 0))
+        frames = np.random.randint(0, self._X.shape[1], 100)
+        snippets = self.RX.get_snippets(reference_frames=frames, snippet_len=20)
+        snippets_sub = self.RX.get_snippets(reference_frames=frames, snippet_len=20, channel_ids=[2])
+        self.RX._snippets_chunk_bytes = 1000
+        self.assertTrue(np.array_equal(self.RX.get_snippets(reference_frames=frames, snippet_len=20), snippets))
+        self.assertTrue(np.array_equal(self.RX.get_snippets(reference_frames=frames, snippet_len=20,
+                                                            channel_ids=[2]), snippets_sub))
+        self.RX._snippets_numba_min = 0
+        self.assertTrue(np.array_equal(self.RX.get_snippets(reference_frames=frames, snippet_len=20), snippets))
+        self.RX._snippets_specialize_min = 0
+        self.assertTrue(np.array_equal(self.RX.get_snippets(reference_frames=frames, snippet_len=20), snippets))
+        out = np.ones((2, self._X.shape[0], 20))
+        snippets = self.RX.get_snippets(reference_frames=[0, 30], snippet_len=20, out=out)
+        self.assertTrue(snippets is out)
+        self.assertTrue(np.allclose(out[0][:, :10], 0))
+        self.assertTrue(np.allclose(out[1], self._X[:, 20:40]))
+        with self.assertRaises(ValueError):
+            self.RX.get_snippets(reference_frames=[0, 30], snippet_len=20, out=out.astype('int16'))
+        # snippets keep the dtype of the traces
+        RX_int16 = se.NumpyRecordingExtractor(timeseries=(self._X * 100).astype('int16'),
+                                              sampling_frequency=self._sampling_frequency)
+        self.assertEqual(RX_int16.get_dtype(), np.dtype('int16'))
+        snippets = RX_int16.get_snippets(reference_frames=[0, 30], snippet_len=20)
+        self.assertEqual(snippets.dtype, np.dtype('int16'))
+        self.assertTrue(np.array_equal(snippets[1], RX_int16.get_traces(start_frame=20, end_frame=40)))
+        out = np.empty((12, self._X.shape[0]))
+        self.RX.get_traces_array(start_frame=0, end_frame=12, time_axis=0, out=out)
+        self.assertTrue(np.allclose(out, self._X[:, 0:12].T))
 
     def test_sorting_extractor(self):
         unit_ids = [1, 2, 3]
@@ -53,6 +115,41 @@ class TestNumpyExtractors(unittest.TestCase):
         # get_unit_spike_train
         st = self.SX.get_unit_spike_train(unit_id=1)
         self.assertTrue(np.allclose(st, self._train1))
+        # get_unit_spike_train_cached
+        self.SX.precompute_spike_trains()
+        for start_frame, end_frame in [(None, None), (100, 5000), (None, 2000), (3000, None)]:
+            st = np.sort(self.SX.get_unit_spike_train(1, start_frame=start_frame, end_frame=end_frame))
+            self.assertTrue(np.array_equal(
+                self.SX.get_unit_spike_train_cached(1, start_frame=start_frame, end_frame=end_frame), st))
+        # to_spike_vector
+        spike_vector = self.SX.to_spike_vector()
+        self.assertTrue(self.SX.to_spike_vector() is spike_vector)
+        self.assertTrue(np.all(np.diff(spike_vector['sample_ind']) >= 0))
+        for unit_ind, unit_id in enumerate(unit_ids):
+            self.assertTrue(np.array_equal(spike_vector['sample_ind'][spike_vector['unit_ind'] == unit_ind],
+                                           np.sort(self.SX.get_unit_spike_train(unit_id))))
+        self.SX.add_unit(unit_id=4, times=np.array([5, 2, 9]))
+        self.assertTrue(self.SX._spike_vector is None)
+        self.assertTrue(self.SX._spike_train_cache is None)
+        self.assertTrue(np.array_equal(self.SX.get_unit_spike_train_cached(4, start_frame=3), [5, 9]))
+        # bulk property setters go through an overridden set_unit_property
+        class LoggingSortingExtractor(se.NumpySortingExtractor):
+            def __init__(self):
+                se.NumpySortingExtractor.__init__(self)
+                self.set_calls = []
+
+            def set_unit_property(self, unit_id, property_name, value):
+                self.set_calls.append((unit_id, property_name))
+                se.NumpySortingExtractor.set_unit_property(self, unit_id, property_name, value)
+
+        SX2 = LoggingSortingExtractor()
+        SX2.add_unit(unit_id=1, times=self._train1)
+        SX2.add_unit(unit_id=2, times=self._train1)
+        SX2.set_units_property(unit_ids=[1, 2], property_name='quality', values=['good', 'bad'])
+        self.SX.set_unit_property(1, 'depth', 10)
+        SX2.copy_unit_properties(self.SX, unit_ids=[1])
+        self.assertEqual(SX2.set_calls, [(1, 'quality'), (2, 'quality'), (1, 'depth')])
+        self.assertEqual(SX2.get_unit_property(2, 'quality'), 'bad')
 
 
 if __name__ == '__main__':